@@ -0,0 +1,80 @@
+"""
+Классы аутентификации для API.
+
+Этот модуль содержит JWT аутентификацию с кэшированием пользователей
+и проверенных токенов, чтобы защищённые endpoints не обращались к БД
+и не проверяли подпись токена на каждый запрос.
+"""
+import hashlib
+import threading
+import time
+
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+from .caching import user_cache_key
+
+
+# Время хранения пользователя в кэше (секунды). Кэш по умолчанию
+# (LocMemCache) свой у каждого воркера gunicorn, а сигналы сбрасывают
+# запись только в воркере, обработавшем изменение, поэтому срок должен
+# быть коротким: деактивация и изменения профиля видны не позже чем через него
+USER_CACHE_TTL = 10
+# Время хранения проверенного токена в памяти процесса (секунды)
+TOKEN_CACHE_TTL = 10
+# Максимальное количество токенов в кэше процесса
+TOKEN_CACHE_MAXSIZE = 10_000
+
+# sha256(токен) -> (проверенный токен, момент истечения записи)
+_token_cache = {}
+_token_cache_lock = threading.Lock()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT аутентификация с кэшированием пользователя.
+
+    Стандартный JWTAuthentication выполняет SELECT пользователя на каждый
+    запрос. Этот класс сохраняет найденного пользователя в кэше Django
+    на USER_CACHE_TTL секунд, поэтому серия запросов обращается к БД один раз.
+
+    Проверенные токены дополнительно хранятся в памяти процесса на
+    TOKEN_CACHE_TTL секунд (но не дольше срока действия токена), поэтому
+    серия запросов с одним токеном проверяет подпись только один раз.
+
+    Note:
+        Сигналы сбрасывают кэш пользователя при сохранении или удалении
+        (см. api/signals.py), но только в текущем процессе: без общего
+        кэша (Redis, Memcached) другие воркеры видят изменения, в том
+        числе деактивацию, через USER_CACHE_TTL секунд.
+    """
+
+    def get_validated_token(self, raw_token):
+        key = hashlib.sha256(raw_token).hexdigest()
+        now = time.time()
+        with _token_cache_lock:
+            entry = _token_cache.get(key)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+
+        validated_token = super().get_validated_token(raw_token)
+        expires_at = min(now + TOKEN_CACHE_TTL, validated_token.get('exp', now))
+        with _token_cache_lock:
+            if len(_token_cache) >= TOKEN_CACHE_MAXSIZE:
+                # Вытесняем самую старую запись
+                _token_cache.pop(next(iter(_token_cache)))
+            _token_cache[key] = (validated_token, expires_at)
+        return validated_token
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            return super().get_user(validated_token)
+
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(validated_token)
+            cache.set(key, user, USER_CACHE_TTL)
+        return user
@@ -0,0 +1,70 @@
+"""
+Кэширование данных API.
+
+Этот модуль содержит ключи и сброс кэша пользователей для JWT
+аутентификации и кэша публичного маркетплейса. Кэш маркетплейса
+версионируется: при изменении словарей версия увеличивается,
+и все ранее сохранённые страницы перестают использоваться.
+
+Note:
+    Модуль импортируется обработчиками сигналов при запуске Django,
+    поэтому не должен зависеть от DRF и simplejwt.
+"""
+import hashlib
+
+from django.core.cache import cache, caches
+
+# Время хранения страницы маркетплейса в кэше (секунды)
+MARKETPLACE_CACHE_TTL = 30
+
+_MARKETPLACE_VERSION_KEY = 'marketplace:version'
+
+# Отдельный кэш для страниц маркетплейса (см. CACHES в settings.py)
+marketplace_cache = caches['marketplace']
+
+
+def user_cache_key(user_id):
+    """Возвращает ключ кэша для пользователя с указанным ID."""
+    return f'jwt_user:{user_id}'
+
+
+def invalidate_cached_user(user_id):
+    """Удаляет пользователя из кэша (например, после изменения профиля)."""
+    cache.delete(user_cache_key(user_id))
+
+
+def _marketplace_version():
+    """Возвращает текущую версию кэша маркетплейса."""
+    return marketplace_cache.get_or_set(_MARKETPLACE_VERSION_KEY, 1, None)
+
+
+def marketplace_cache_key(request):
+    """
+    Возвращает ключ кэша страницы маркетплейса для запроса.
+
+    Ключ строится из хоста (ссылки на обложки и соседние страницы
+    абсолютные), номера страницы и текущей версии кэша. Остальные
+    параметры запроса не учитываются, чтобы произвольные параметры
+    не создавали новые записи в кэше.
+
+    Returns:
+        str | None: Ключ кэша или None, если номер страницы не является
+        положительным числом (такой запрос обрабатывается без кэша).
+    """
+    try:
+        page = int(request.GET.get('page', 1))
+    except ValueError:
+        return None
+    if page < 1:
+        return None
+    host_hash = hashlib.md5(request.get_host().encode('utf-8')).hexdigest()
+    return f'marketplace:v{_marketplace_version()}:{host_hash}:{page}'
+
+
+def invalidate_marketplace_cache():
+    """Сбрасывает кэш маркетплейса, увеличивая его версию."""
+    try:
+        marketplace_cache.incr(_MARKETPLACE_VERSION_KEY)
+    except ValueError:
+        # Версии ещё нет в кэше - новые ключи и так не совпадут со старыми
+        marketplace_cache.set(_MARKETPLACE_VERSION_KEY, 2, None)
@@ -81,16 +81,21 @@ class Command(BaseCommand):
         
         total_added = 0
         
-        for dictionary in dictionaries:
+        # Словари читаются из БД порциями, а не загружаются в память целиком
+        dictionaries = dictionaries.only('id', 'name', 'source_lang', 'target_lang')
+        for dictionary in dictionaries.iterator(chunk_size=2000):
             # Пропускаем словари, которые не английско-русские
             if dictionary.source_lang.lower() != 'en' or dictionary.target_lang.lower() != 'ru':
                 continue
             
             # Получаем уже существующие слова
-            existing_words = Word.objects.filter(dictionary=dictionary).values_list('word', flat=True)
+            existing_words = {
+                word.lower()
+                for word in Word.objects.filter(dictionary=dictionary).values_list('word', flat=True)
+            }
             
             # Фильтруем слова, которые еще не добавлены
-            available_words = [w for w in english_words if w['word'].lower() not in [ew.lower() for ew in existing_words]]
+            available_words = [w for w in english_words if w['word'].lower() not in existing_words]
             
             # Выбираем случайные слова
             words_to_add = random.sample(available_words, min(words_per_dict, len(available_words)))
@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from api.models import Dictionary, Word
+from api.views import get_unsplash_images
+
+
+class Command(BaseCommand):
+    help = 'Подбирает изображения из Unsplash для словарей и слов без изображений'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=20,
+            help='Количество параллельных запросов к Unsplash в одной пачке (по умолчанию 20)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        # Словари без файла и без URL обложки. Для словарей, созданных до
+        # появления cover_image_file, файл хранится как NULL, а Django
+        # отбрасывает None из __in, поэтому NULL проверяется отдельно
+        dictionaries = Dictionary.objects.filter(
+            Q(cover_image_file='') | Q(cover_image_file__isnull=True),
+            cover_image='',
+        ).values_list('id', 'name')
+        dict_count = self.fill(Dictionary, 'cover_image', list(dictionaries), batch_size)
+
+        # Слова без изображения
+        words = Word.objects.filter(image_url='').values_list('id', 'word')
+        word_count = self.fill(Word, 'image_url', list(words), batch_size)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'\n✅ Обновлено обложек: {dict_count}, изображений слов: {word_count}'
+            )
+        )
+
+    def fill(self, model, field, rows, batch_size):
+        """Подбирает изображения пачками и сохраняет найденные URL."""
+        updated = 0
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            image_urls = get_unsplash_images([query for _, query in batch])
+            for pk, query in batch:
+                image_url = image_urls.get(query)
+                if image_url:
+                    updated += model.objects.filter(pk=pk).update(**{field: image_url})
+        return updated
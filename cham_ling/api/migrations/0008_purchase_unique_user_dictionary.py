@@ -0,0 +1,38 @@
+# Generated by Django 4.2.14 on 2026-10-15 22:30
+
+from django.db import migrations, models
+
+
+def remove_duplicate_purchases(apps, schema_editor):
+    """
+    Удаляет повторные покупки одного словаря одним пользователем.
+
+    Раньше проверка exists() и create() выполнялись без блокировки, и
+    параллельные запросы могли создать несколько покупок. Сохраняется
+    самая ранняя покупка, иначе ограничение уникальности не создастся.
+    """
+    Purchase = apps.get_model('api', 'Purchase')
+    duplicates = (
+        Purchase.objects.values('user_id', 'dictionary_id')
+        .annotate(first_id=models.Min('id'), total=models.Count('id'))
+        .filter(total__gt=1)
+    )
+    for row in duplicates:
+        Purchase.objects.filter(
+            user_id=row['user_id'], dictionary_id=row['dictionary_id']
+        ).exclude(id=row['first_id']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_learningprogress'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_purchases, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='purchase',
+            constraint=models.UniqueConstraint(fields=('user', 'dictionary'), name='uniq_user_dict_purchase'),
+        ),
+    ]
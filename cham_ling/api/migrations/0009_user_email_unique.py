@@ -0,0 +1,43 @@
+# Generated by Django 4.2.14 on 2026-10-15 22:30
+
+from django.db import migrations, models
+
+# Домен для временных адресов: зона .invalid зарезервирована (RFC 2606)
+# и не может совпасть с настоящим email
+PLACEHOLDER_EMAIL_DOMAIN = 'users.invalid'
+
+
+def resolve_blank_and_duplicate_emails(apps, schema_editor):
+    """
+    Готовит email пользователей к ограничению уникальности.
+
+    Раньше email был необязательным и мог повторяться (в том числе
+    пустой email у createsuperuser). Пустые адреса и повторы (кроме
+    самого раннего пользователя с этим адресом) заменяются на
+    <username>@users.invalid - username уникален, поэтому адреса
+    не совпадут. Такие пользователи должны указать email заново.
+    """
+    User = apps.get_model('api', 'User')
+    seen = set()
+    for user in User.objects.order_by('id').only('id', 'username', 'email'):
+        if user.email and user.email not in seen:
+            seen.add(user.email)
+            continue
+        user.email = f'{user.username}@{PLACEHOLDER_EMAIL_DOMAIN}'
+        user.save(update_fields=['email'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_purchase_unique_user_dictionary'),
+    ]
+
+    operations = [
+        migrations.RunPython(resolve_blank_and_duplicate_emails, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='user',
+            name='email',
+            field=models.EmailField(help_text='Email пользователя, используется для входа.', max_length=254, unique=True, verbose_name='email address'),
+        ),
+    ]
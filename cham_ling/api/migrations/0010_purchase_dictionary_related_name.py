@@ -0,0 +1,19 @@
+# Generated by Django 4.2.14 on 2026-10-15 22:33
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_user_email_unique'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='purchase',
+            name='dictionary',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='purchases', to='api.dictionary'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.14 on 2026-10-15 22:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_purchase_dictionary_related_name'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dictionary',
+            index=models.Index(condition=models.Q(('is_for_sale', True)), fields=['is_for_sale'], name='dict_for_sale_partial'),
+        ),
+    ]
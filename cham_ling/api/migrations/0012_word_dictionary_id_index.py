@@ -0,0 +1,17 @@
+# Generated by Django 4.2.14 on 2026-10-15 22:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_dictionary_for_sale_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='word',
+            index=models.Index(fields=['dictionary', 'id'], name='api_word_diction_552738_idx'),
+        ),
+    ]
@@ -17,6 +17,7 @@ class User(AbstractUser):
     для будущей реализации системы платежей и покупок словарей.
 
     Attributes:
+        email: Email пользователя (уникален, используется для входа).
         balance: Текущий баланс пользователя в условных единицах.
                  Максимальное значение: 9,999,999.99
 
@@ -24,6 +25,11 @@ class User(AbstractUser):
         Используются уникальные related_name для groups и user_permissions,
         чтобы избежать конфликтов с дефолтными полями Django.
     """
+    email = models.EmailField(
+        'email address',
+        unique=True,
+        help_text="Email пользователя, используется для входа."
+    )
     balance = models.DecimalField(
         max_digits=10,
         decimal_places=2,
@@ -105,6 +111,17 @@ class Dictionary(models.Model):
     cover_image_file = models.ImageField(upload_to='dictionaries/covers/', blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        """Метаданные модели."""
+        indexes = [
+            # Частичный индекс для маркетплейса: только словари на продажу
+            models.Index(
+                fields=['is_for_sale'],
+                condition=models.Q(is_for_sale=True),
+                name='dict_for_sale_partial'
+            ),
+        ]
+
     def __str__(self):
         """Возвращает название словаря."""
         return self.name
@@ -156,6 +173,13 @@ class Word(models.Model):
     example = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        """Метаданные модели."""
+        indexes = [
+            # Постраничный список слов словаря, упорядоченный по id
+            models.Index(fields=['dictionary', 'id']),
+        ]
+
     def __str__(self):
         """Возвращает строковое представление слова и перевода."""
         return f"{self.word} -> {self.translation}"
@@ -178,6 +202,10 @@ class Purchase(models.Model):
         access_type может быть:
         - 'permanent': Постоянный доступ к словарю.
         - 'temporary': Временный доступ (срок определяется словарём).
+
+    Note:
+        Используется уникальное ограничение (user, dictionary), чтобы
+        пользователь не мог купить один и тот же словарь дважды.
     """
     ACCESS_CHOICES = [
         ('permanent', 'Permanent'),
@@ -185,7 +213,11 @@ class Purchase(models.Model):
     ]
 
     user = models.ForeignKey(User, on_delete=models.CASCADE)
-    dictionary = models.ForeignKey(Dictionary, on_delete=models.CASCADE)
+    dictionary = models.ForeignKey(
+        Dictionary,
+        on_delete=models.CASCADE,
+        related_name='purchases'
+    )
     access_type = models.CharField(max_length=10, choices=ACCESS_CHOICES)
     purchased_at = models.DateTimeField(auto_now_add=True)
 
@@ -193,6 +225,12 @@ class Purchase(models.Model):
         """Метаданные модели."""
         verbose_name = "Покупка"
         verbose_name_plural = "Покупки"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'dictionary'],
+                name='uniq_user_dict_purchase'
+            ),
+        ]
 
     def __str__(self):
         """Возвращает строковое представление покупки."""
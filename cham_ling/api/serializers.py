@@ -6,7 +6,10 @@
 """
 from rest_framework import serializers
 from django.contrib.auth import authenticate
-from .models import Dictionary, Word, LearningProgress
+from django.contrib.auth.validators import UnicodeUsernameValidator
+from django.utils.encoding import filepath_to_uri
+from django.utils.functional import cached_property
+from .models import Dictionary, Word, Purchase, LearningProgress
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
@@ -83,7 +86,13 @@ class RegisterSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['username', 'email', 'password']
-        extra_kwargs = {'password': {'write_only': True}}
+        # Уникальность username и email проверяется ограничениями БД при
+        # вставке, а не отдельными запросами в валидаторах
+        extra_kwargs = {
+            'password': {'write_only': True},
+            'username': {'validators': [UnicodeUsernameValidator()]},
+            'email': {'validators': []},
+        }
 
     def create(self, validated_data):
         """
@@ -201,7 +210,7 @@ class DictionarySerializer(serializers.ModelSerializer):
         """
         request = self.context.get('request')
         if request and request.user and request.user.is_authenticated:
-            return obj.owner == request.user
+            return obj.owner_id == request.user.id
         return False
     
     def get_word_count(self, obj):
@@ -228,7 +237,6 @@ class DictionarySerializer(serializers.ModelSerializer):
         """
         request = self.context.get('request')
         if request and request.user and request.user.is_authenticated:
-            from .models import Purchase
             return Purchase.objects.filter(user=request.user, dictionary=obj).exists()
         return False
 
@@ -286,6 +294,57 @@ class DictionarySerializer(serializers.ModelSerializer):
                 raise serializers.ValidationError("Описание обязательно для словаря на продажу.")
         return data
 
+class DictionaryListSerializer(DictionarySerializer):
+    """
+    Облегчённый сериализатор Dictionary для списков словарей.
+
+    Используется в списке словарей пользователя и в магазине.
+    Работает только на чтение и не возвращает поля, которые нужны
+    лишь на странице словаря (created_at).
+
+    Computed Fields:
+        Те же, что и в DictionarySerializer. is_owner, is_purchased и
+        word_count читаются из аннотаций queryset
+        (см. annotate_dictionary_list во views).
+    """
+    is_owner = serializers.BooleanField(read_only=True)
+    is_purchased = serializers.BooleanField(read_only=True)
+    word_count = serializers.IntegerField(read_only=True)
+
+    @cached_property
+    def _media_base_url(self):
+        """
+        Абсолютный URL каталога медиафайлов.
+
+        Вычисляется один раз на весь список (при many=True все строки
+        сериализует один и тот же экземпляр).
+        """
+        base_url = Dictionary._meta.get_field('cover_image_file').storage.base_url
+        request = self.context.get('request')
+        if request:
+            return request.build_absolute_uri(base_url)
+        return base_url
+
+    def get_cover_image_url(self, obj):
+        """
+        Возвращает полный URL обложки словаря.
+
+        То же, что DictionarySerializer.get_cover_image_url, но без
+        обращения к хранилищу и build_absolute_uri для каждой строки.
+        """
+        if obj.cover_image_file:
+            return self._media_base_url + filepath_to_uri(obj.cover_image_file.name)
+        return obj.cover_image if obj.cover_image else None
+
+    class Meta(DictionarySerializer.Meta):
+        fields = [
+            'id', 'owner', 'name', 'description', 'source_lang', 'target_lang',
+            'price', 'allow_temporary_access', 'temporary_days', 'is_for_sale',
+            'cover_image', 'cover_image_url', 'is_owner', 'word_count', 'is_purchased'
+        ]
+        read_only_fields = fields
+        extra_kwargs = {}
+
 class WordSerializer(serializers.ModelSerializer):
     """
     Сериализатор для модели Word.
@@ -342,7 +401,7 @@ class LearningProgressSerializer(serializers.ModelSerializer):
 
     Fields:
         id: Уникальный идентификатор прогресса.
-        dictionary: ID словаря.
+        dictionary: ID словаря (read-only, задаётся из URL).
         learned_words: Массив ID изученных слов.
         learned_words_count: Количество изученных слов (read-only).
         total_words: Общее количество слов в словаре (read-only).
@@ -359,7 +418,8 @@ class LearningProgressSerializer(serializers.ModelSerializer):
             'id', 'dictionary', 'learned_words', 'learned_words_count',
             'total_words', 'progress_percentage', 'last_updated'
         ]
-        read_only_fields = ['id', 'last_updated']
+        # Словарь берётся из URL, а не из тела запроса
+        read_only_fields = ['id', 'dictionary', 'last_updated']
 
     def get_learned_words_count(self, obj):
         """Возвращает количество изученных слов."""
@@ -378,7 +438,8 @@ class LearningProgressSerializer(serializers.ModelSerializer):
         Создаёт или обновляет прогресс изучения для текущего пользователя.
 
         Если прогресс уже существует, обновляет его.
-        Если нет - создаёт новый.
+        Если нет - создаёт новый. Словарь передаётся через
+        serializer.save(dictionary=...), так как поле только для чтения.
         """
         request = self.context.get('request')
         user = request.user
@@ -0,0 +1,44 @@
+"""
+Обработчики сигналов моделей.
+
+Сбрасывают кэшированные данные при изменении связанных объектов
+и настраивают новые соединения с БД.
+"""
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .caching import invalidate_cached_user, invalidate_marketplace_cache
+from .models import Dictionary, User, Word
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_user_cache(sender, instance, **kwargs):
+    """Сбрасывает кэш пользователя для JWT аутентификации."""
+    invalidate_cached_user(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Dictionary)
+@receiver([post_save, post_delete], sender=Word)
+def invalidate_marketplace(sender, instance, **kwargs):
+    """Сбрасывает кэш маркетплейса (список словарей и количество слов)."""
+    invalidate_marketplace_cache()
+
+
+@receiver(connection_created)
+def configure_sqlite(sender, connection, **kwargs):
+    """
+    Включает режим WAL для SQLite (локальная разработка).
+
+    В WAL чтение не блокируется записью, а synchronous=NORMAL реже
+    вызывает fsync при коммите. Бэкенд SQLite в Django 4.2 не
+    поддерживает init_command в OPTIONS, поэтому PRAGMA выполняются
+    при создании каждого соединения.
+    """
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA journal_mode=WAL;')
+        cursor.execute('PRAGMA synchronous=NORMAL;')
+        cursor.execute('PRAGMA cache_size=-64000;')
+        cursor.execute('PRAGMA temp_store=MEMORY;')
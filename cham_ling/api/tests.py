@@ -246,7 +246,7 @@ class RegisterViewTest(APITestCase):
         response = self.client.post(self.register_url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('already exists', response.data['detail'].lower())
+        self.assertEqual(response.data['detail'], 'User with this email already exists.')
     
     def test_register_duplicate_username(self):
         """Тест регистрации с дублирующимся username"""
@@ -264,7 +264,7 @@ class RegisterViewTest(APITestCase):
         response = self.client.post(self.register_url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('already exists', response.data['detail'].lower())
+        self.assertEqual(response.data['detail'], 'User with this username already exists.')
 
 
 class LoginViewTest(APITestCase):
@@ -348,7 +348,22 @@ class DictionaryCreateViewTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data['name'], 'Test Dictionary')
         self.assertTrue(Dictionary.objects.filter(name='Test Dictionary').exists())
-    
+
+    @patch('api.views.get_unsplash_image')
+    def test_create_dictionary_cover_fetched_in_background(self, mock_unsplash):
+        """Тест что обложка из Unsplash подбирается после ответа, а не в запросе"""
+        data = {
+            'name': 'Test Dictionary',
+            'source_lang': 'en',
+            'target_lang': 'ru'
+        }
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post(self.create_url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        mock_unsplash.assert_not_called()
+        self.assertEqual(len(callbacks), 1)
+
     def test_create_dictionary_required_fields(self):
         """Тест создания словаря с обязательными полями"""
         data = {
@@ -466,18 +481,49 @@ class DictionaryListViewTest(APITestCase):
         response = self.client.get(self.list_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['name'], 'User Dictionary')
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(response.data['results'][0]['name'], 'User Dictionary')
     
     def test_list_dictionaries_only_own(self):
         """Тест что пользователь видит только свои словари"""
         response = self.client.get(self.list_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        dictionary_names = [d['name'] for d in response.data]
+        dictionary_names = [d['name'] for d in response.data['results']]
         self.assertIn('User Dictionary', dictionary_names)
         self.assertNotIn('Other Dictionary', dictionary_names)
     
+    def test_list_dictionaries_annotated_fields(self):
+        """Тест вычисляемых полей списка без запросов на каждую строку"""
+        Purchase.objects.create(user=self.user, dictionary=self.other_dict, access_type='permanent')
+        for i in range(3):
+            Word.objects.create(dictionary=self.other_dict, word=f'word{i}', translation=f'слово{i}')
+        self.client.get(self.list_url)  # Прогреваем кэш пользователя
+        
+        # Один запрос на количество и один на страницу словарей
+        with self.assertNumQueries(2):
+            response = self.client.get(self.list_url)
+        
+        results = {d['name']: d for d in response.data['results']}
+        self.assertTrue(results['User Dictionary']['is_owner'])
+        self.assertFalse(results['User Dictionary']['is_purchased'])
+        self.assertEqual(results['User Dictionary']['word_count'], 0)
+        self.assertFalse(results['Other Dictionary']['is_owner'])
+        self.assertTrue(results['Other Dictionary']['is_purchased'])
+        self.assertEqual(results['Other Dictionary']['word_count'], 3)
+    
+    def test_list_dictionaries_cover_image_url(self):
+        """Тест абсолютного URL обложки из файла в списке словарей"""
+        self.user_dict.cover_image_file = 'dictionaries/covers/cover.jpg'
+        self.user_dict.save()
+        
+        response = self.client.get(self.list_url)
+        
+        self.assertEqual(
+            response.data['results'][0]['cover_image_url'],
+            'http://testserver/media/dictionaries/covers/cover.jpg'
+        )
+    
     def test_list_dictionaries_unauthorized(self):
         """Тест получения списка без аутентификации"""
         self.client.credentials()  # Убираем токен
@@ -492,6 +538,10 @@ class MarketplaceViewTest(APITestCase):
     
     def setUp(self):
         """Настройка перед каждым тестом"""
+        from django.core.cache import caches
+        caches['default'].clear()
+        caches['marketplace'].clear()
+        
         self.client = APIClient()
         self.user = User.objects.create_user(
             username='testuser',
@@ -523,7 +573,7 @@ class MarketplaceViewTest(APITestCase):
         response = self.client.get(self.marketplace_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        dictionary_names = [d['name'] for d in response.data]
+        dictionary_names = [d['name'] for d in response.data['results']]
         self.assertIn('For Sale Dictionary', dictionary_names)
         self.assertNotIn('Not For Sale Dictionary', dictionary_names)
     
@@ -533,7 +583,82 @@ class MarketplaceViewTest(APITestCase):
         response = self.client.get(self.marketplace_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertFalse(response.data['results'][0]['is_owner'])
+    
+    def test_marketplace_anonymous_cached(self):
+        """Тест что анонимный запрос маркетплейса берётся из кэша"""
+        self.client.get(self.marketplace_url)
+        
+        with self.assertNumQueries(0):
+            response = self.client.get(self.marketplace_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+    
+    def test_marketplace_cache_ignores_unknown_params(self):
+        """Тест что посторонние параметры не создают новые записи в кэше"""
+        from django.core.cache import caches
+        
+        self.client.get(self.marketplace_url)
+        
+        with self.assertNumQueries(0):
+            response = self.client.get(self.marketplace_url, {'x': 'random'})
+        self.assertEqual(len(response.data['results']), 1)
+        
+        caches['marketplace'].clear()
+        self.client.get(self.marketplace_url, {'x': 'other'})
+        # Ответ с посторонним параметром не сохраняется в кэш
+        with self.assertNumQueries(2):
+            self.client.get(self.marketplace_url)
+    
+    def test_marketplace_invalid_page_not_cached(self):
+        """Тест что некорректный номер страницы обрабатывается без кэша"""
+        response = self.client.get(self.marketplace_url, {'page': 'abc'})
+        
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+    
+    def test_marketplace_cache_invalidated_on_change(self):
+        """Тест что кэш маркетплейса сбрасывается при изменении словарей"""
+        self.client.get(self.marketplace_url)
+        self.not_for_sale_dict.is_for_sale = True
+        self.not_for_sale_dict.save()
+        
+        response = self.client.get(self.marketplace_url)
+        
+        self.assertEqual(len(response.data['results']), 2)
+    
+    def test_marketplace_is_owner_for_owner(self):
+        """Тест поля is_owner для владельца словаря"""
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        
+        response = self.client.get(self.marketplace_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['results'][0]['is_owner'])
+    
+    def test_marketplace_paginated(self):
+        """Тест постраничной выдачи маркетплейса"""
+        for i in range(50):
+            Dictionary.objects.create(
+                owner=self.user,
+                name=f'Extra Dictionary {i}',
+                description='Test description',
+                source_lang='en',
+                target_lang='ru',
+                is_for_sale=True
+            )
+        
+        response = self.client.get(self.marketplace_url)
+        
+        self.assertEqual(response.data['count'], 51)
+        self.assertEqual(len(response.data['results']), 50)
+        self.assertIsNotNone(response.data['next'])
+        
+        response = self.client.get(self.marketplace_url, {'page': 2})
+        
+        self.assertEqual(len(response.data['results']), 1)
 
 
 class WordCreateViewTest(APITestCase):
@@ -608,6 +733,332 @@ class WordCreateViewTest(APITestCase):
             pass
 
 
+class DictionaryDetailViewTest(APITestCase):
+    """Тесты для DictionaryDetailView"""
+    
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123'
+        )
+        self.dictionary = Dictionary.objects.create(
+            owner=self.user,
+            name='User Dictionary',
+            source_lang='en',
+            target_lang='ru'
+        )
+        self.other_dict = Dictionary.objects.create(
+            owner=self.other_user,
+            name='Other Dictionary',
+            description='Test description',
+            source_lang='en',
+            target_lang='ru',
+            is_for_sale=True
+        )
+        
+        # Создаем токен для аутентификации
+        refresh = RefreshToken.for_user(self.user)
+        self.token = str(refresh.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
+    
+    def test_get_own_dictionary(self):
+        """Тест получения своего словаря"""
+        response = self.client.get(f'/api/dictionaries/{self.dictionary.id}/')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['name'], 'User Dictionary')
+        self.assertTrue(response.data['is_owner'])
+    
+    def test_get_purchased_dictionary(self):
+        """Тест получения купленного словаря"""
+        Purchase.objects.create(user=self.user, dictionary=self.other_dict, access_type='permanent')
+        
+        response = self.client.get(f'/api/dictionaries/{self.other_dict.id}/')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.data['is_owner'])
+        self.assertTrue(response.data['is_purchased'])
+    
+    def test_get_foreign_dictionary_forbidden(self):
+        """Тест получения чужого некупленного словаря"""
+        response = self.client.get(f'/api/dictionaries/{self.other_dict.id}/')
+        
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+    
+    def test_get_nonexistent_dictionary(self):
+        """Тест получения несуществующего словаря"""
+        response = self.client.get('/api/dictionaries/99999/')
+        
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+    
+    def test_update_own_dictionary(self):
+        """Тест обновления своего словаря"""
+        response = self.client.put(
+            f'/api/dictionaries/{self.dictionary.id}/',
+            {'name': 'Renamed', 'cover_image': 'https://example.com/cover.jpg'},
+            format='json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.dictionary.refresh_from_db()
+        self.assertEqual(self.dictionary.name, 'Renamed')
+    
+    def test_update_foreign_dictionary_forbidden(self):
+        """Тест обновления чужого словаря"""
+        response = self.client.put(
+            f'/api/dictionaries/{self.other_dict.id}/',
+            {'name': 'Renamed'},
+            format='json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+    
+    def test_delete_own_dictionary(self):
+        """Тест удаления своего словаря"""
+        response = self.client.delete(f'/api/dictionaries/{self.dictionary.id}/')
+        
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Dictionary.objects.filter(pk=self.dictionary.id).exists())
+    
+    def test_delete_foreign_dictionary_forbidden(self):
+        """Тест удаления чужого словаря"""
+        response = self.client.delete(f'/api/dictionaries/{self.other_dict.id}/')
+        
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertTrue(Dictionary.objects.filter(pk=self.other_dict.id).exists())
+
+
+class DictionaryWordsViewTest(APITestCase):
+    """Тесты для DictionaryWordsView"""
+    
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123'
+        )
+        self.dictionary = Dictionary.objects.create(
+            owner=self.user,
+            name='User Dictionary',
+            source_lang='en',
+            target_lang='ru'
+        )
+        self.other_dict = Dictionary.objects.create(
+            owner=self.other_user,
+            name='Other Dictionary',
+            source_lang='en',
+            target_lang='ru'
+        )
+        Word.objects.create(dictionary=self.dictionary, word='Hello', translation='Привет')
+        Word.objects.create(dictionary=self.dictionary, word='World', translation='Мир')
+        Word.objects.create(dictionary=self.other_dict, word='Cat', translation='Кот')
+        
+        # Создаем токен для аутентификации
+        refresh = RefreshToken.for_user(self.user)
+        self.token = str(refresh.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
+    
+    def test_get_words_own_dictionary(self):
+        """Тест получения слов своего словаря"""
+        response = self.client.get(f'/api/dictionaries/{self.dictionary.id}/words/')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        words = [w['word'] for w in response.data['results']]
+        self.assertEqual(words, ['Hello', 'World'])
+    
+    def test_get_words_purchased_dictionary(self):
+        """Тест получения слов купленного словаря"""
+        Purchase.objects.create(user=self.user, dictionary=self.other_dict, access_type='permanent')
+        
+        response = self.client.get(f'/api/dictionaries/{self.other_dict.id}/words/')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+    
+    def test_get_words_forbidden(self):
+        """Тест получения слов чужого словаря"""
+        response = self.client.get(f'/api/dictionaries/{self.other_dict.id}/words/')
+        
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+    
+    def test_get_words_nonexistent_dictionary(self):
+        """Тест получения слов несуществующего словаря"""
+        response = self.client.get('/api/dictionaries/99999/words/')
+        
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class PurchaseDictionaryViewTest(APITestCase):
+    """Тесты для PurchaseDictionaryView"""
+    
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.seller = User.objects.create_user(
+            username='seller',
+            email='seller@example.com',
+            password='testpass123'
+        )
+        self.dictionary = Dictionary.objects.create(
+            owner=self.seller,
+            name='For Sale Dictionary',
+            description='Test description',
+            source_lang='en',
+            target_lang='ru',
+            is_for_sale=True,
+            price=10.00
+        )
+        self.purchase_url = f'/api/dictionaries/{self.dictionary.id}/purchase/'
+        
+        # Создаем токен для аутентификации
+        refresh = RefreshToken.for_user(self.user)
+        self.token = str(refresh.access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.token}')
+    
+    def test_purchase_success(self):
+        """Тест успешной покупки словаря"""
+        response = self.client.post(self.purchase_url, {'payment_code': '1013'}, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['dictionary_id'], self.dictionary.id)
+        self.assertEqual(response.data['dictionary_name'], self.dictionary.name)
+        self.assertEqual(response.data['access_type'], 'permanent')
+        self.assertTrue(Purchase.objects.filter(user=self.user, dictionary=self.dictionary).exists())
+    
+    def test_purchase_twice(self):
+        """Тест повторной покупки того же словаря"""
+        self.client.post(self.purchase_url, {'payment_code': '1013'}, format='json')
+        response = self.client.post(self.purchase_url, {'payment_code': '1013'}, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('already purchased', response.data['detail'])
+        self.assertEqual(Purchase.objects.filter(user=self.user, dictionary=self.dictionary).count(), 1)
+    
+    def test_purchase_concurrent_duplicate(self):
+        """Тест что нарушение уникальности при гонке возвращает 400"""
+        from django.db import IntegrityError
+        
+        with patch('api.views.Purchase.objects.create', side_effect=IntegrityError):
+            response = self.client.post(self.purchase_url, {'payment_code': '1013'}, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('already purchased', response.data['detail'])
+    
+    def test_purchase_invalid_code(self):
+        """Тест покупки с неверным кодом оплаты"""
+        response = self.client.post(self.purchase_url, {'payment_code': '0000'}, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Purchase.objects.exists())
+    
+    def test_purchase_own_dictionary(self):
+        """Тест покупки собственного словаря"""
+        refresh = RefreshToken.for_user(self.seller)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+        
+        response = self.client.post(self.purchase_url, {'payment_code': '1013'}, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    
+    def test_purchase_nonexistent_dictionary(self):
+        """Тест покупки несуществующего словаря"""
+        response = self.client.post('/api/dictionaries/99999/purchase/', {'payment_code': '1013'}, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data['detail'], 'Dictionary not found.')
+
+
+class CachedJWTAuthenticationTest(APITestCase):
+    """Тесты для CachedJWTAuthentication"""
+    
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        from django.core.cache import cache
+        cache.clear()
+        
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.profile_url = '/api/user/profile/'
+        
+        refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+    
+    def test_user_lookup_cached(self):
+        """Тест что повторный запрос не загружает пользователя из БД"""
+        self.client.get(self.profile_url)
+        
+        with self.assertNumQueries(0):
+            response = self.client.get(self.profile_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['username'], 'testuser')
+    
+    def test_cache_invalidated_on_profile_update(self):
+        """Тест что изменения профиля видны сразу после обновления"""
+        self.client.get(self.profile_url)
+        self.client.put(self.profile_url, {'notification_hour': 20}, format='json')
+        
+        response = self.client.get(self.profile_url)
+        
+        self.assertEqual(response.data['notification_hour'], 20)
+    
+    def test_user_cached_briefly(self):
+        """Тест что пользователь кэшируется только на USER_CACHE_TTL секунд"""
+        from django.core.cache import cache
+        from .authentication import USER_CACHE_TTL
+        
+        with patch.object(cache, 'set', wraps=cache.set) as mock_set:
+            self.client.get(self.profile_url)
+        
+        mock_set.assert_any_call(f'jwt_user:{self.user.pk}', self.user, USER_CACHE_TTL)
+    
+    def test_validated_token_cached(self):
+        """Тест что подпись токена проверяется один раз для серии запросов"""
+        from rest_framework_simplejwt.authentication import JWTAuthentication
+        
+        with patch.object(
+            JWTAuthentication, 'get_validated_token',
+            autospec=True, side_effect=JWTAuthentication.get_validated_token
+        ) as mock_validate:
+            self.client.get(self.profile_url)
+            response = self.client.get(self.profile_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(mock_validate.call_count, 1)
+    
+    def test_invalid_token_rejected(self):
+        """Тест что неверный токен не попадает в кэш и отклоняется"""
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer invalid.token.value')
+        
+        response = self.client.get(self.profile_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
 # ==================== Тесты сериализаторов ====================
 
 class DictionarySerializerTest(TestCase):
@@ -877,13 +1328,16 @@ class LearningProgressViewTest(APITestCase):
         self.assertIn('learned_words_count', response.data)
         self.assertIn('progress_percentage', response.data)
     
-    def test_get_learning_progress_creates_if_not_exists(self):
-        """Тест создания прогресса если его нет"""
+    def test_get_learning_progress_empty_if_not_exists(self):
+        """Тест получения пустого прогресса без создания записи"""
         url = f'/api/dictionaries/{self.dictionary.id}/progress/'
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertTrue(LearningProgress.objects.filter(
+        self.assertEqual(response.data['learned_words'], [])
+        self.assertEqual(response.data['progress_percentage'], 0)
+        self.assertEqual(response.data['dictionary'], self.dictionary.id)
+        self.assertFalse(LearningProgress.objects.filter(
             user=self.user,
             dictionary=self.dictionary
         ).exists())
@@ -926,6 +1380,29 @@ class LearningProgressViewTest(APITestCase):
         progress.refresh_from_db()
         self.assertEqual(progress.learned_words.count(), 2)
     
+    def test_save_learning_progress_ignores_body_dictionary(self):
+        """Тест что словарь из тела запроса игнорируется и берётся из URL"""
+        other_dictionary = Dictionary.objects.create(
+            owner=self.user,
+            name='Other Dictionary',
+            source_lang='en',
+            target_lang='ru'
+        )
+        url = f'/api/dictionaries/{self.dictionary.id}/progress/'
+        
+        for body_dictionary in (99999, other_dictionary.id):
+            response = self.client.post(url, {
+                'learned_words': [self.word1.id],
+                'dictionary': body_dictionary
+            }, format='json')
+            
+            self.assertIn(response.status_code, (status.HTTP_200_OK, status.HTTP_201_CREATED))
+            self.assertEqual(response.data['dictionary'], self.dictionary.id)
+        
+        progress = LearningProgress.objects.get(user=self.user)
+        self.assertEqual(progress.dictionary, self.dictionary)
+        self.assertEqual(list(progress.learned_words.all()), [self.word1])
+    
     def test_save_learning_progress_unauthorized(self):
         """Тест сохранения прогресса без аутентификации"""
         self.client.credentials()  # Убираем токен
@@ -978,3 +1455,194 @@ class LearningProgressViewTest(APITestCase):
         self.assertEqual(response.data['progress_percentage'], 50)
         self.assertEqual(response.data['learned_words_count'], 1)
         self.assertEqual(response.data['total_words'], 2)
+
+
+# ==================== Тесты Unsplash ====================
+
+class UnsplashImagesTest(TestCase):
+    """Тесты для пакетного получения изображений из Unsplash"""
+
+    @patch('api.views.get_unsplash_image')
+    def test_get_unsplash_images_deduplicates_queries(self, mock_unsplash):
+        """Тест что одинаковые запросы отправляются один раз"""
+        from .views import get_unsplash_images
+
+        mock_unsplash.side_effect = lambda query: f'https://example.com/{query}.jpg'
+
+        result = get_unsplash_images(['cat', 'dog', 'cat'])
+
+        self.assertEqual(result, {
+            'cat': 'https://example.com/cat.jpg',
+            'dog': 'https://example.com/dog.jpg',
+        })
+        self.assertEqual(mock_unsplash.call_count, 2)
+
+    def test_get_unsplash_images_empty(self):
+        """Тест пустого списка запросов"""
+        from .views import get_unsplash_images
+
+        self.assertEqual(get_unsplash_images([]), {})
+    
+    @patch('api.views.connection')
+    @patch('api.views.get_unsplash_image')
+    def test_fill_image_keeps_user_image(self, mock_unsplash, mock_connection):
+        """Тест что фоновая загрузка не перезаписывает уже заданное изображение"""
+        from .views import _fill_image
+        
+        mock_unsplash.return_value = 'https://example.com/unsplash.jpg'
+        owner = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        empty = Dictionary.objects.create(
+            owner=owner, name='Empty', source_lang='en', target_lang='ru'
+        )
+        custom = Dictionary.objects.create(
+            owner=owner, name='Custom', source_lang='en', target_lang='ru',
+            cover_image='https://example.com/custom.jpg'
+        )
+        
+        _fill_image(Dictionary, empty.pk, 'cover_image', 'Empty')
+        _fill_image(Dictionary, custom.pk, 'cover_image', 'Custom')
+        
+        empty.refresh_from_db()
+        custom.refresh_from_db()
+        self.assertEqual(empty.cover_image, 'https://example.com/unsplash.jpg')
+        self.assertEqual(custom.cover_image, 'https://example.com/custom.jpg')
+
+
+
+class FillMissingImagesCommandTest(TestCase):
+    """Тесты для команды fill_missing_images"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+
+    @patch('api.management.commands.fill_missing_images.get_unsplash_images')
+    def test_fills_dictionaries_and_words_without_images(self, mock_unsplash):
+        """Тест заполнения обложек (в том числе с NULL файлом) и изображений слов"""
+        from io import StringIO
+        from django.core.management import call_command
+
+        mock_unsplash.side_effect = lambda queries: {
+            query: f'https://example.com/{query}.jpg' for query in queries
+        }
+        null_file = Dictionary.objects.create(
+            owner=self.user, name='Old', source_lang='en', target_lang='ru'
+        )
+        Dictionary.objects.filter(pk=null_file.pk).update(cover_image_file=None)
+        empty_file = Dictionary.objects.create(
+            owner=self.user, name='New', source_lang='en', target_lang='ru',
+            cover_image_file=''
+        )
+        with_file = Dictionary.objects.create(
+            owner=self.user, name='Uploaded', source_lang='en', target_lang='ru',
+            cover_image_file='dictionaries/covers/uploaded.jpg'
+        )
+        with_url = Dictionary.objects.create(
+            owner=self.user, name='Custom', source_lang='en', target_lang='ru',
+            cover_image='https://example.com/custom.jpg'
+        )
+        word = Word.objects.create(dictionary=with_url, word='cat', translation='кот')
+
+        call_command('fill_missing_images', stdout=StringIO())
+
+        for dictionary in (null_file, empty_file, with_file, with_url):
+            dictionary.refresh_from_db()
+        word.refresh_from_db()
+        self.assertEqual(null_file.cover_image, 'https://example.com/Old.jpg')
+        self.assertEqual(empty_file.cover_image, 'https://example.com/New.jpg')
+        self.assertEqual(with_file.cover_image, '')
+        self.assertEqual(with_url.cover_image, 'https://example.com/custom.jpg')
+        self.assertEqual(word.image_url, 'https://example.com/cat.jpg')
+
+class UnsplashCacheTest(TestCase):
+    """Тесты для кэширования запросов к Unsplash"""
+    
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        from django.core.cache import cache
+        cache.clear()
+    
+    @patch('api.views._HTTP_SESSION.get')
+    def test_get_unsplash_image_cached(self, mock_get):
+        """Тест что повторный запрос берётся из кэша"""
+        from .views import get_unsplash_image
+        
+        mock_get.return_value = Mock(
+            json=Mock(return_value={'urls': {'regular': 'https://example.com/cat.jpg'}})
+        )
+        
+        self.assertEqual(get_unsplash_image('Cat'), 'https://example.com/cat.jpg')
+        self.assertEqual(get_unsplash_image(' cat '), 'https://example.com/cat.jpg')
+        self.assertEqual(mock_get.call_count, 1)
+    
+    @patch('api.views._HTTP_SESSION.get')
+    def test_get_unsplash_image_failure_cached(self, mock_get):
+        """Тест что неудачный запрос тоже кэшируется"""
+        import requests
+        from .views import get_unsplash_image
+        
+        mock_get.side_effect = requests.ConnectionError()
+        
+        self.assertIsNone(get_unsplash_image('cat'))
+        self.assertIsNone(get_unsplash_image('cat'))
+        self.assertEqual(mock_get.call_count, 1)
+    
+    @patch('api.views._HTTP_SESSION.get')
+    def test_get_unsplash_image_empty_result_cached(self, mock_get):
+        """Тест что ответ без изображения кэшируется на короткое время"""
+        from django.core.cache import cache
+        from .views import get_unsplash_image, UNSPLASH_NEGATIVE_CACHE_TTL, UNSPLASH_CACHE_TTL
+        
+        mock_get.return_value = Mock(json=Mock(return_value={}))
+        
+        with patch.object(cache, 'set', wraps=cache.set) as mock_set:
+            self.assertIsNone(get_unsplash_image('cat'))
+        
+        self.assertIsNone(get_unsplash_image('cat'))
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(mock_set.call_args.args[1:], ('', UNSPLASH_NEGATIVE_CACHE_TTL))
+        self.assertLess(UNSPLASH_NEGATIVE_CACHE_TTL, UNSPLASH_CACHE_TTL)
+    
+    @patch('api.views._HTTP_SESSION.get')
+    def test_get_unsplash_image_timeout(self, mock_get):
+        """Тест что таймаут Unsplash не прерывает запрос"""
+        import requests
+        from .views import get_unsplash_image, EXTERNAL_REQUEST_TIMEOUT
+        
+        mock_get.side_effect = requests.Timeout()
+        
+        with self.assertLogs('api.views', level='WARNING'):
+            self.assertIsNone(get_unsplash_image('cat'))
+        self.assertEqual(mock_get.call_args.kwargs['timeout'], EXTERNAL_REQUEST_TIMEOUT)
+    
+    def test_get_unsplash_image_concurrent_misses_coalesced(self):
+        """Тест что одновременные промахи кэша дают один запрос к Unsplash"""
+        import threading
+        import time
+        from .views import get_unsplash_image
+        
+        def slow_fetch(query):
+            time.sleep(0.2)
+            return 'https://example.com/cat.jpg'
+        
+        results = []
+        with patch('api.views._fetch_unsplash_image', side_effect=slow_fetch) as mock_fetch:
+            threads = [
+                threading.Thread(target=lambda: results.append(get_unsplash_image('cat')))
+                for _ in range(3)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        self.assertEqual(mock_fetch.call_count, 1)
+        self.assertEqual(results, ['https://example.com/cat.jpg'] * 3)
@@ -8,24 +8,37 @@ API View классы для обработки HTTP запросов.
 - Магазин словарей (marketplace)
 - Покупка словарей
 """
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status, generics
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework.exceptions import NotFound
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.hashers import make_password
 from django.contrib.auth import authenticate
+from django.core.cache import cache
+from django.db import IntegrityError, connection, transaction
+from django.db.models import BooleanField, Case, Count, Exists, OuterRef, Q, Value, When
 
+from .authentication import CachedJWTAuthentication
+from .caching import MARKETPLACE_CACHE_TTL, marketplace_cache, marketplace_cache_key
 from .models import User, Dictionary, Word, Purchase, LearningProgress
 from .serializers import (
     LoginSerializer,
     UserSerializer,
     UserProfileSerializer,
     DictionarySerializer,
+    DictionaryListSerializer,
     WordSerializer,
     RegisterSerializer,
     LearningProgressSerializer,
@@ -33,6 +46,36 @@ from .serializers import (
 
 User = get_user_model()
 
+logger = logging.getLogger(__name__)
+
+# Поля словаря, которые читает DictionaryListSerializer
+DICTIONARY_LIST_FIELDS = (
+    'id', 'owner', 'name', 'description', 'source_lang', 'target_lang',
+    'price', 'allow_temporary_access', 'temporary_days', 'is_for_sale',
+    'cover_image', 'cover_image_file',
+)
+
+
+def get_tokens_for_user(user):
+    """
+    Выпускает пару JWT токенов для пользователя.
+
+    Каждый токен подписывается ровно один раз: access токен берётся
+    из refresh объекта однократно (свойство access_token при каждом
+    обращении создаёт и подписывает новый токен).
+
+    Args:
+        user: Пользователь, для которого выпускаются токены.
+
+    Returns:
+        dict: Токены 'access' и 'refresh'.
+    """
+    refresh = RefreshToken.for_user(user)
+    return {
+        'access': str(refresh.access_token),
+        'refresh': str(refresh)
+    }
+
 
 class RegisterView(APIView):
     """
@@ -59,39 +102,29 @@ class RegisterView(APIView):
     permission_classes = [AllowAny]
 
     def post(self, request):
-        username = request.data.get('username')
-        email = request.data.get('email')
-        password = request.data.get('password')
-
-        if not username or not email or not password:
-            return Response(
-                {'detail': 'Username, email and password are required.'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        if User.objects.filter(email=email).exists():
-            return Response(
-                {'detail': 'User with this email already exists.'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        if User.objects.filter(username=username).exists():
-            return Response(
-                {'detail': 'User with this username already exists.'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        serializer = RegisterSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-        user = User.objects.create_user(
-            username=username,
-            email=email,
-            password=password
-        )
-
-        refresh = RefreshToken.for_user(user)
-        return Response({
-            'access': str(refresh.access_token),
-            'refresh': str(refresh)
-        }, status=status.HTTP_201_CREATED)
+        try:
+            with transaction.atomic():
+                user = serializer.save()
+        except IntegrityError:
+            # Уникальность проверяет БД; здесь одним запросом только
+            # определяем, какое поле занято, чтобы вернуть точное сообщение
+            email = User.objects.normalize_email(serializer.validated_data.get('email'))
+            username = serializer.validated_data.get('username')
+            existing = User.objects.filter(
+                Q(email=email) | Q(username=username)
+            ).values_list('username', flat=True).first()
+            if existing == username:
+                detail = 'User with this username already exists.'
+            else:
+                detail = 'User with this email already exists.'
+            return Response({'detail': detail}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Клиент сразу входит в приложение после регистрации
+        return Response(get_tokens_for_user(user), status=status.HTTP_201_CREATED)
 
 
 class LoginView(APIView):
@@ -121,14 +154,44 @@ class LoginView(APIView):
         serializer = LoginSerializer(data=request.data)
         if serializer.is_valid():
             user = serializer.validated_data['user']
-            refresh = RefreshToken.for_user(user)
-            return Response({
-                'access': str(refresh.access_token),
-                'refresh': str(refresh)
-            }, status=status.HTTP_200_OK)
+            return Response(get_tokens_for_user(user), status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+# Таймауты внешних HTTP запросов (подключение, чтение) в секундах
+EXTERNAL_REQUEST_TIMEOUT = (0.3, 0.5)
+# Общая HTTP сессия: соединения (TCP + TLS) с Unsplash переиспользуются
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=100,
+    max_retries=Retry(total=1, backoff_factor=0.1)
+))
+# Фиксируем версию API Unsplash, чтобы формат ответа не менялся
+_HTTP_SESSION.headers['Accept-Version'] = 'v1'
+# Время хранения найденного изображения Unsplash в кэше (секунды)
+UNSPLASH_CACHE_TTL = 3600
+# Время хранения неудачного результата, чтобы не повторять запрос сразу
+UNSPLASH_NEGATIVE_CACHE_TTL = 60
+# Сколько ждать результата запроса, который уже выполняет другой поток (секунды)
+UNSPLASH_INFLIGHT_WAIT = 2
+
+# Ключ кэша -> событие завершения запроса к Unsplash, выполняемого сейчас
+_unsplash_inflight = {}
+_unsplash_inflight_lock = threading.Lock()
+
+
+def _unsplash_cache_key(query):
+    """
+    Возвращает ключ кэша для поискового запроса Unsplash.
+
+    Запрос приводится к нижнему регистру и хэшируется, чтобы ключ
+    был допустимым для любого бэкенда кэша (пробелы, кириллица).
+    """
+    normalized = (query or '').strip().lower()
+    return 'unsplash:' + hashlib.md5(normalized.encode('utf-8')).hexdigest()
+
+
 def get_unsplash_image(query):
     """
     Получает изображение из Unsplash API по запросу.
@@ -145,7 +208,42 @@ def get_unsplash_image(query):
     Note:
         Требует настройки UNSPLASH_API_KEY в settings.py.
         При ошибке запроса возвращает None без выбрасывания исключения.
+        Результат кэшируется: найденный URL на UNSPLASH_CACHE_TTL,
+        отсутствие изображения на UNSPLASH_NEGATIVE_CACHE_TTL.
+        Одновременные промахи кэша по одному запросу объединяются:
+        к Unsplash обращается только первый поток, остальные ждут его.
     """
+    cache_key = _unsplash_cache_key(query)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        # Пустая строка означает закэшированное отсутствие изображения
+        return cached or None
+    
+    with _unsplash_inflight_lock:
+        event = _unsplash_inflight.get(cache_key)
+        is_leader = event is None
+        if is_leader:
+            event = _unsplash_inflight[cache_key] = threading.Event()
+    
+    if not is_leader:
+        event.wait(UNSPLASH_INFLIGHT_WAIT)
+        return cache.get(cache_key) or None
+    
+    try:
+        image_url = _fetch_unsplash_image(query)
+        if image_url:
+            cache.set(cache_key, image_url, UNSPLASH_CACHE_TTL)
+        else:
+            cache.set(cache_key, '', UNSPLASH_NEGATIVE_CACHE_TTL)
+    finally:
+        with _unsplash_inflight_lock:
+            del _unsplash_inflight[cache_key]
+        event.set()
+    return image_url
+
+
+def _fetch_unsplash_image(query):
+    """Выполняет запрос к Unsplash API без кэширования."""
     url = "https://api.unsplash.com/photos/random"
     params = {
         "client_id": settings.UNSPLASH_API_KEY,
@@ -153,20 +251,203 @@ def get_unsplash_image(query):
         "orientation": "landscape"
     }
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = _HTTP_SESSION.get(url, params=params, timeout=EXTERNAL_REQUEST_TIMEOUT)
         response.raise_for_status()
         data = response.json()
         return data.get("urls", {}).get("regular")
+    except requests.Timeout:
+        logger.warning('Unsplash request timed out for query %r', query)
+        return None
     except requests.RequestException:
         return None
 
 
+def get_unsplash_images(queries):
+    """
+    Получает изображения из Unsplash сразу для нескольких запросов.
+
+    Запросы выполняются параллельно, поэтому пачка из N запросов
+    занимает примерно столько же времени, сколько один запрос.
+    Повторяющиеся запросы отправляются только один раз.
+
+    Args:
+        queries (list[str]): Поисковые запросы для изображений.
+
+    Returns:
+        dict: Отображение запрос -> URL изображения (или None).
+    """
+    unique_queries = list(dict.fromkeys(queries))
+    if not unique_queries:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(8, len(unique_queries))) as executor:
+        image_urls = executor.map(get_unsplash_image, unique_queries)
+    return dict(zip(unique_queries, image_urls))
+
+
+def image_missing(request, url_field, file_field=None):
+    """
+    Проверяет, что в запросе не передано изображение.
+
+    Args:
+        request: HTTP запрос.
+        url_field: Поле с URL изображения.
+        file_field: Поле с файлом изображения (если есть).
+
+    Returns:
+        bool: True, если нет ни файла, ни URL и изображение нужно
+            подобрать из Unsplash.
+    """
+    if file_field and request.FILES.get(file_field):
+        return False
+    return not request.data.get(url_field)
+
+
+def _fill_image(model, pk, field, query):
+    """
+    Загружает изображение из Unsplash и записывает его URL в поле объекта.
+
+    Выполняется в фоновом потоке, поэтому по завершении закрывает
+    собственное соединение с БД. Поле обновляется, только если оно
+    всё ещё пустое: изображение, заданное пользователем за время
+    запроса к Unsplash, не перезаписывается.
+    """
+    try:
+        image_url = get_unsplash_image(query)
+        if image_url:
+            model.objects.filter(pk=pk, **{field: ''}).update(**{field: image_url})
+    finally:
+        connection.close()
+
+
+def fill_image_in_background(model, pk, field, query):
+    """
+    Подбирает изображение из Unsplash в фоне, не блокируя ответ клиенту.
+
+    Поток запускается только после коммита транзакции, чтобы объект
+    уже был виден в БД к моменту обновления.
+
+    Args:
+        model: Класс модели (Dictionary или Word).
+        pk: ID объекта, которому нужно изображение.
+        field (str): Имя поля для URL изображения.
+        query (str): Поисковый запрос для Unsplash.
+    """
+    def start():
+        threading.Thread(
+            target=_fill_image,
+            args=(model, pk, field, query),
+            daemon=True
+        ).start()
+
+    transaction.on_commit(start)
+
+
+def _get_dictionary(pk, *fields, **annotations):
+    """
+    Загружает словарь по ID.
+
+    Args:
+        pk: ID словаря.
+        *fields: Поля, которые нужно загрузить. Если не указаны,
+            загружаются все поля.
+        **annotations: Аннотации, вычисляемые в том же запросе.
+
+    Returns:
+        Dictionary: Найденный словарь.
+
+    Raises:
+        NotFound: Если словарь не найден (DRF вернёт ответ 404).
+    """
+    queryset = Dictionary.objects.all()
+    if fields:
+        queryset = queryset.only(*fields)
+    if annotations:
+        queryset = queryset.annotate(**annotations)
+    try:
+        return queryset.get(pk=pk)
+    except Dictionary.DoesNotExist:
+        raise NotFound('Dictionary not found.')
+
+
+def get_accessible_dictionary(user, pk, *fields):
+    """
+    Загружает словарь, к которому у пользователя есть доступ.
+
+    Доступ есть у владельца словаря и у пользователей, купивших его.
+    Проверка доступа и загрузка словаря выполняются одним запросом.
+
+    Args:
+        user: Текущий пользователь.
+        pk: ID словаря.
+        *fields: Поля, которые нужно загрузить. Если не указаны,
+            загружаются все поля.
+
+    Returns:
+        Dictionary or None: Словарь или None, если словаря нет
+        или у пользователя нет к нему доступа.
+    """
+    queryset = Dictionary.objects.filter(pk=pk).filter(
+        Q(owner=user) | Q(purchases__user=user)
+    )
+    if fields:
+        queryset = queryset.only(*fields)
+    return queryset.first()
+
+
+def _no_access_response(pk):
+    """
+    Возвращает ответ об ошибке, когда словарь недоступен пользователю.
+
+    Отличает отсутствующий словарь (404) от чужого (403)
+    дополнительным запросом, который выполняется только при ошибке.
+    """
+    if Dictionary.objects.filter(pk=pk).exists():
+        return Response(
+            {'detail': 'You do not have access to this dictionary.'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    return Response(
+        {'detail': 'Dictionary not found.'},
+        status=status.HTTP_404_NOT_FOUND
+    )
+
+
+def annotate_dictionary_list(queryset, user):
+    """
+    Добавляет к словарям поля is_owner, is_purchased и word_count,
+    вычисленные в SQL, чтобы список сериализовался без запросов на строку.
+
+    Args:
+        queryset: QuerySet словарей.
+        user: Текущий пользователь (может быть анонимным).
+
+    Returns:
+        QuerySet: Словари с аннотациями is_owner, is_purchased и word_count.
+    """
+    if user.is_authenticated:
+        is_purchased = Exists(
+            Purchase.objects.filter(user_id=user.id, dictionary_id=OuterRef('pk'))
+        )
+    else:
+        is_purchased = Value(False, output_field=BooleanField())
+    user_id = user.id if user.is_authenticated else None
+    return queryset.annotate(
+        is_owner=Case(
+            When(owner_id=user_id, then=Value(True)),
+            default=Value(False),
+            output_field=BooleanField()
+        ),
+        is_purchased=is_purchased,
+        word_count=Count('words', distinct=True),
+    )
+
+
 class DictionaryCreateView(APIView):
     """
     API endpoint для создания нового словаря.
 
     Создаёт словарь с указанными параметрами. Если не указана обложка,
-    автоматически подбирает изображение из Unsplash API.
+    она подбирается из Unsplash API в фоне уже после ответа клиенту.
 
     Methods:
         post(request): Создаёт новый словарь для текущего пользователя.
@@ -188,27 +469,23 @@ class DictionaryCreateView(APIView):
     Permissions:
         IsAuthenticated - требуется авторизация.
     """
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
-        data = request.data.copy()
-        
-        # Если загружен файл - используем его, иначе проверяем URL
-        if request.FILES.get('cover_image_file'):
-            # Файл уже в request.FILES, не нужно обрабатывать
-            pass
-        elif not data.get('cover_image'):
-            # Если нет ни файла, ни URL - получаем из Unsplash
-            query = data.get('name', 'language dictionary')
-            image_url = get_unsplash_image(query)
-            if image_url:
-                data['cover_image'] = image_url
+        data = request.data
+        
+        # Если нет ни файла, ни URL - обложку подберём из Unsplash после создания
+        needs_cover = image_missing(request, 'cover_image', 'cover_image_file')
         
         serializer = DictionarySerializer(data=data, context={'request': request})
         serializer.is_valid(raise_exception=True)
         dictionary = serializer.save()
         
+        if needs_cover:
+            query = data.get('name', 'language dictionary')
+            fill_image_in_background(Dictionary, dictionary.pk, 'cover_image', query)
+        
         # Возвращаем URL изображения (из файла или URL)
         cover_image_url = None
         if dictionary.cover_image_file:
@@ -229,7 +506,7 @@ class WordCreateView(APIView):
     API endpoint для добавления слова в словарь.
 
     Создаёт новое слово с переводом в указанном словаре.
-    Если не указано изображение, автоматически подбирает из Unsplash.
+    Если не указано изображение, оно подбирается из Unsplash в фоне.
 
     Methods:
         post(request): Добавляет слово в словарь.
@@ -249,18 +526,16 @@ class WordCreateView(APIView):
     Permissions:
         IsAuthenticated - требуется авторизация.
     """
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [IsAuthenticated]
     def post(self, request):
-        data = request.data.copy()
-        if not data.get('image_url'):
-            query = data.get('word', 'language')
-            image_url = get_unsplash_image(query)
-            if image_url:
-                data['image_url'] = image_url
+        data = request.data
         serializer = WordSerializer(data=data, context={'request': request})
         serializer.is_valid(raise_exception=True)
         word = serializer.save()
+        if image_missing(request, 'image_url'):
+            query = data.get('word', 'language')
+            fill_image_in_background(Word, word.pk, 'image_url', query)
         return Response({
             'id': word.id,
             'word': word.word,
@@ -269,7 +544,7 @@ class WordCreateView(APIView):
         }, status=status.HTTP_201_CREATED)
 
 
-class DictionaryListView(APIView):
+class DictionaryListView(generics.ListAPIView):
     """
     API endpoint для получения списка словарей пользователя.
 
@@ -280,33 +555,31 @@ class DictionaryListView(APIView):
     Methods:
         get(request): Возвращает список словарей пользователя.
 
+    Query Params:
+        - page: Номер страницы (по умолчанию 1)
+
     Returns:
-        - 200 OK: Список словарей пользователя
+        - 200 OK: Страница списка словарей пользователя (count, next, previous, results)
 
     Permissions:
         IsAuthenticated - требуется авторизация.
     """
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [IsAuthenticated]
+    serializer_class = DictionaryListSerializer
 
-    def get(self, request):
-        # Получаем словари, где пользователь является владельцем
-        owned_dictionaries = Dictionary.objects.filter(owner=request.user)
-        
-        # Получаем словари, которые пользователь купил
-        purchased_dictionaries_ids = Purchase.objects.filter(
-            user=request.user
-        ).values_list('dictionary_id', flat=True)
-        purchased_dictionaries = Dictionary.objects.filter(id__in=purchased_dictionaries_ids)
-        
-        # Объединяем оба списка (используем distinct чтобы избежать дубликатов)
-        all_dictionaries = (owned_dictionaries | purchased_dictionaries).distinct()
-        
-        serializer = DictionarySerializer(all_dictionaries, many=True, context={'request': request})
-        return Response(serializer.data)
+    def get_queryset(self):
+        user = self.request.user
+        # Словари, где пользователь владелец или покупатель, одним запросом
+        # (distinct убирает дубликаты от JOIN с покупками)
+        all_dictionaries = Dictionary.objects.filter(
+            Q(owner=user) | Q(purchases__user=user)
+        ).distinct()
+        all_dictionaries = annotate_dictionary_list(all_dictionaries, user)
+        return all_dictionaries.only(*DICTIONARY_LIST_FIELDS).order_by('id')
 
 
-class MarketplaceView(APIView):
+class MarketplaceView(generics.ListAPIView):
     """
     API endpoint для получения списка словарей в магазине.
 
@@ -317,21 +590,47 @@ class MarketplaceView(APIView):
     Methods:
         get(request): Возвращает список словарей на продажу.
 
+    Query Params:
+        - page: Номер страницы (по умолчанию 1)
+
     Returns:
-        - 200 OK: Список словарей в магазине
+        - 200 OK: Страница списка словарей в магазине (count, next, previous, results)
 
     Permissions:
         AllowAny - доступно всем пользователям (публичный endpoint).
         Поддерживает опциональную JWT аутентификацию для определения is_owner.
+
+    Note:
+        Ответы анонимным пользователям кэшируются на MARKETPLACE_CACHE_TTL
+        секунд; кэш сбрасывается при изменении словарей и слов (api/signals.py).
     """
     permission_classes = [AllowAny]  # Публичный доступ
-    authentication_classes = [JWTAuthentication]  # Поддерживаем аутентификацию для определения is_owner
-
-    def get(self, request):
+    authentication_classes = [CachedJWTAuthentication]  # Поддерживаем аутентификацию для определения is_owner
+    # ListAPIView передаёт request в context сериализатора для определения is_owner
+    serializer_class = DictionaryListSerializer
+
+    def list(self, request, *args, **kwargs):
+        # Анонимные запросы одинаковы для всех - отдаём их из кэша
+        if request.user.is_authenticated:
+            return super().list(request, *args, **kwargs)
+        
+        cache_key = marketplace_cache_key(request)
+        if cache_key is None:
+            return super().list(request, *args, **kwargs)
+        
+        data = marketplace_cache.get(cache_key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            # Ссылки next/previous повторяют параметры запроса, поэтому
+            # сохраняем только ответы на запросы без посторонних параметров
+            if set(request.query_params) <= {'page'}:
+                marketplace_cache.set(cache_key, data, MARKETPLACE_CACHE_TTL)
+        return Response(data)
+
+    def get_queryset(self):
         dictionaries = Dictionary.objects.filter(is_for_sale=True)
-        # Передаем request в context для определения is_owner даже если пользователь не залогинен
-        serializer = DictionarySerializer(dictionaries, many=True, context={'request': request})
-        return Response(serializer.data)
+        dictionaries = annotate_dictionary_list(dictionaries, self.request.user)
+        return dictionaries.only(*DICTIONARY_LIST_FIELDS).order_by('id')
 
 
 class DictionaryDetailView(APIView):
@@ -365,95 +664,70 @@ class DictionaryDetailView(APIView):
     Permissions:
         IsAuthenticated - требуется авторизация.
     """
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request, pk):
         """Получить детали словаря"""
-        try:
-            dictionary = Dictionary.objects.get(pk=pk)
-            # Пользователь может видеть только свои словари
-            if dictionary.owner != request.user:
-                # Проверяем покупки
-                from .models import Purchase
-                if not Purchase.objects.filter(user=request.user, dictionary=dictionary).exists():
-                    return Response(
-                        {'detail': 'You do not have access to this dictionary.'},
-                        status=status.HTTP_403_FORBIDDEN
-                    )
-            
-            serializer = DictionarySerializer(dictionary, context={'request': request})
-            return Response(serializer.data)
-        except Dictionary.DoesNotExist:
-            return Response(
-                {'detail': 'Dictionary not found.'},
-                status=status.HTTP_404_NOT_FOUND
-            )
+        # Пользователь может видеть только свои или купленные словари
+        dictionary = get_accessible_dictionary(request.user, pk)
+        if dictionary is None:
+            return _no_access_response(pk)
+        
+        serializer = DictionarySerializer(dictionary, context={'request': request})
+        return Response(serializer.data)
 
     def put(self, request, pk):
         """Обновить словарь (только владелец)"""
-        try:
-            dictionary = Dictionary.objects.get(pk=pk)
-            if dictionary.owner != request.user:
-                return Response(
-                    {'detail': 'You can only update your own dictionaries.'},
-                    status=status.HTTP_403_FORBIDDEN
-                )
-            
-            data = request.data.copy()
-            
-            # Обработка файла изображения
-            if request.FILES.get('cover_image_file'):
-                pass  # Файл уже в request.FILES
-            elif not data.get('cover_image') and not dictionary.cover_image_file:
-                # Если нет изображения - получаем из Unsplash
-                query = data.get('name', dictionary.name)
-                image_url = get_unsplash_image(query)
-                if image_url:
-                    data['cover_image'] = image_url
-            
-            serializer = DictionarySerializer(dictionary, data=data, partial=True, context={'request': request})
-            serializer.is_valid(raise_exception=True)
-            updated_dict = serializer.save()
-            
-            # Возвращаем URL изображения
-            cover_image_url = None
-            if updated_dict.cover_image_file:
-                cover_image_url = request.build_absolute_uri(updated_dict.cover_image_file.url)
-            elif updated_dict.cover_image:
-                cover_image_url = updated_dict.cover_image
-            
-            return Response({
-                'id': updated_dict.id,
-                'name': updated_dict.name,
-                'cover_image_url': cover_image_url
-            })
-        except Dictionary.DoesNotExist:
+        dictionary = _get_dictionary(pk)
+        if dictionary.owner_id != request.user.id:
             return Response(
-                {'detail': 'Dictionary not found.'},
-                status=status.HTTP_404_NOT_FOUND
+                {'detail': 'You can only update your own dictionaries.'},
+                status=status.HTTP_403_FORBIDDEN
             )
+        
+        data = request.data
+        # Поля, которые добавляются к данным запроса при сохранении
+        extra = {}
+        
+        # Если нет изображения ни в запросе, ни у словаря - получаем из Unsplash
+        if image_missing(request, 'cover_image', 'cover_image_file') and not dictionary.cover_image_file:
+            query = data.get('name', dictionary.name)
+            image_url = get_unsplash_image(query)
+            if image_url:
+                extra['cover_image'] = image_url
+        
+        serializer = DictionarySerializer(dictionary, data=data, partial=True, context={'request': request})
+        serializer.is_valid(raise_exception=True)
+        updated_dict = serializer.save(**extra)
+        
+        # Возвращаем URL изображения
+        cover_image_url = None
+        if updated_dict.cover_image_file:
+            cover_image_url = request.build_absolute_uri(updated_dict.cover_image_file.url)
+        elif updated_dict.cover_image:
+            cover_image_url = updated_dict.cover_image
+        
+        return Response({
+            'id': updated_dict.id,
+            'name': updated_dict.name,
+            'cover_image_url': cover_image_url
+        })
 
     def delete(self, request, pk):
         """Удалить словарь (только владелец)"""
-        try:
-            dictionary = Dictionary.objects.get(pk=pk)
-            if dictionary.owner != request.user:
-                return Response(
-                    {'detail': 'You can only delete your own dictionaries.'},
-                    status=status.HTTP_403_FORBIDDEN
-                )
-            
-            dictionary.delete()
-            return Response(status=status.HTTP_204_NO_CONTENT)
-        except Dictionary.DoesNotExist:
+        dictionary = _get_dictionary(pk, 'id', 'owner')
+        if dictionary.owner_id != request.user.id:
             return Response(
-                {'detail': 'Dictionary not found.'},
-                status=status.HTTP_404_NOT_FOUND
+                {'detail': 'You can only delete your own dictionaries.'},
+                status=status.HTTP_403_FORBIDDEN
             )
+        
+        dictionary.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class DictionaryWordsView(APIView):
+class DictionaryWordsView(generics.ListAPIView):
     """
     API endpoint для получения списка слов в словаре.
 
@@ -467,38 +741,38 @@ class DictionaryWordsView(APIView):
     Args:
         pk (int): ID словаря.
 
+    Query Params:
+        - page: Номер страницы (по умолчанию 1)
+
     Returns:
-        - 200 OK: Список слов словаря
+        - 200 OK: Страница списка слов словаря (count, next, previous, results)
         - 403 FORBIDDEN: Нет доступа к словарю
         - 404 NOT_FOUND: Словарь не найден
 
     Permissions:
         IsAuthenticated - требуется авторизация.
     """
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [IsAuthenticated]
+    serializer_class = WordSerializer
 
     def get(self, request, pk):
         """Получить слова словаря"""
-        try:
-            dictionary = Dictionary.objects.get(pk=pk)
-            # Пользователь может видеть слова только своих словарей или купленных
-            if dictionary.owner != request.user:
-                from .models import Purchase
-                if not Purchase.objects.filter(user=request.user, dictionary=dictionary).exists():
-                    return Response(
-                        {'detail': 'You do not have access to this dictionary.'},
-                        status=status.HTTP_403_FORBIDDEN
-                    )
-            
-            words = Word.objects.filter(dictionary=dictionary)
-            serializer = WordSerializer(words, many=True)
-            return Response(serializer.data)
-        except Dictionary.DoesNotExist:
-            return Response(
-                {'detail': 'Dictionary not found.'},
-                status=status.HTTP_404_NOT_FOUND
-            )
+        # Пользователь может видеть слова только своих словарей или купленных
+        dictionary = get_accessible_dictionary(request.user, pk, 'id')
+        if dictionary is None:
+            return _no_access_response(pk)
+        
+        return self.list(request, pk)
+
+    def get_queryset(self):
+        return Word.objects.filter(
+            dictionary_id=self.kwargs['pk']
+        ).only(*WordSerializer.Meta.fields).order_by('id')
+
+
+# Код оплаты для симуляции покупки словаря
+VALID_PAYMENT_CODE = '1013'
 
 
 class PurchaseDictionaryView(APIView):
@@ -532,82 +806,90 @@ class PurchaseDictionaryView(APIView):
     Permissions:
         IsAuthenticated - требуется авторизация.
     """
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
+    @transaction.atomic
     def post(self, request, pk):
         """Купить словарь (симуляция через код 1013)"""
-        try:
-            dictionary = Dictionary.objects.get(pk=pk)
-            
-            # Сначала проверяем код оплаты (ранняя валидация)
-            payment_code = request.data.get('payment_code')
-            
-            if not payment_code:
-                return Response(
-                    {'detail': 'Payment code is required.'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            if payment_code != '1013':
-                return Response(
-                    {'detail': 'Invalid payment code. Please enter 1013.'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            # Проверяем, что словарь на продажу
-            if not dictionary.is_for_sale:
-                return Response(
-                    {'detail': 'This dictionary is not for sale.'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            # Проверяем, что пользователь не владелец
-            if dictionary.owner == request.user:
-                return Response(
-                    {'detail': 'You cannot buy your own dictionary.'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            # Проверяем, не куплен ли уже словарь
-            if Purchase.objects.filter(user=request.user, dictionary=dictionary).exists():
-                return Response(
-                    {'detail': 'You have already purchased this dictionary.'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            # Определяем тип доступа (permanent или temporary)
-            access_type = request.data.get('access_type', 'permanent')
-            
-            if access_type not in ['permanent', 'temporary']:
-                access_type = 'permanent'
-            
-            # Создаем покупку
-            purchase = Purchase.objects.create(
-                user=request.user,
-                dictionary=dictionary,
-                access_type=access_type
+        # Сначала проверяем код оплаты (ранняя валидация, без запросов к БД)
+        payment_code = request.data.get('payment_code')
+        
+        if not payment_code:
+            return Response(
+                {'detail': 'Payment code is required.'},
+                status=status.HTTP_400_BAD_REQUEST
             )
-            
-            return Response({
-                'id': purchase.id,
-                'dictionary_id': dictionary.id,
-                'dictionary_name': dictionary.name,
-                'access_type': purchase.access_type,
-                'purchased_at': purchase.purchased_at,
-                'message': 'Dictionary purchased successfully!'
-            }, status=status.HTTP_201_CREATED)
-            
-        except Dictionary.DoesNotExist:
+        
+        if payment_code != VALID_PAYMENT_CODE:
+            return Response(
+                {'detail': f'Invalid payment code. Please enter {VALID_PAYMENT_CODE}.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        # Словарь и признак уже совершённой покупки - одним запросом
+        dictionary = _get_dictionary(
+            pk, 'id', 'name', 'owner', 'is_for_sale',
+            already_purchased=Exists(Purchase.objects.filter(
+                user_id=request.user.id,
+                dictionary_id=OuterRef('pk')
+            ))
+        )
+        
+        # Проверяем, что словарь на продажу
+        if not dictionary.is_for_sale:
             return Response(
-                {'detail': 'Dictionary not found.'},
-                status=status.HTTP_404_NOT_FOUND
+                {'detail': 'This dictionary is not for sale.'},
+                status=status.HTTP_400_BAD_REQUEST
             )
-        except Exception as e:
+        
+        # Проверяем, что пользователь не владелец
+        if dictionary.owner_id == request.user.id:
             return Response(
-                {'detail': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                {'detail': 'You cannot buy your own dictionary.'},
+                status=status.HTTP_400_BAD_REQUEST
             )
+        
+        if dictionary.already_purchased:
+            return self._already_purchased_response()
+        
+        # Определяем тип доступа (permanent или temporary)
+        access_type = request.data.get('access_type', 'permanent')
+        
+        if access_type not in ['permanent', 'temporary']:
+            access_type = 'permanent'
+        
+        # Создаем покупку; уникальное ограничение (user, dictionary)
+        # защищает от двойной покупки при параллельных запросах
+        try:
+            with transaction.atomic():
+                purchase = Purchase.objects.create(
+                    user_id=request.user.id,
+                    dictionary_id=dictionary.id,
+                    access_type=access_type
+                )
+        except IntegrityError:
+            return self._already_purchased_response()
+        
+        # Ответ собирается вручную из уже загруженных объектов, без
+        # сериализатора Purchase: так он не делает запросов к БД
+        # (purchase.dictionary и purchase.user не загружаются)
+        return Response({
+            'id': purchase.id,
+            'dictionary_id': dictionary.id,
+            'dictionary_name': dictionary.name,
+            'access_type': purchase.access_type,
+            'purchased_at': purchase.purchased_at,
+            'message': 'Dictionary purchased successfully!'
+        }, status=status.HTTP_201_CREATED)
+
+    @staticmethod
+    def _already_purchased_response():
+        """Ответ на повторную покупку словаря."""
+        return Response(
+            {'detail': 'You have already purchased this dictionary.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
 
 
 class UserProfileView(APIView):
@@ -637,7 +919,7 @@ class UserProfileView(APIView):
     Permissions:
         IsAuthenticated - требуется авторизация.
     """
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
@@ -693,8 +975,8 @@ class LearningProgressView(APIView):
 
     Returns:
         GET:
-        - 200 OK: Прогресс пользователя по словарю
-        - 404 NOT_FOUND: Прогресс не найден (можно создать через POST)
+        - 200 OK: Прогресс пользователя по словарю (пустой, если ещё не сохранён)
+        - 404 NOT_FOUND: Словарь не найден
 
         POST/PUT:
         - 200 OK или 201 CREATED: Сохранённый прогресс
@@ -704,7 +986,7 @@ class LearningProgressView(APIView):
     Permissions:
         IsAuthenticated - требуется авторизация.
     """
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request, dictionary_id):
@@ -714,33 +996,31 @@ class LearningProgressView(APIView):
         Returns:
             Response: Прогресс пользователя или пустой объект если прогресс не найден.
         """
-        try:
-            dictionary = Dictionary.objects.get(pk=dictionary_id)
-            
-            # Проверяем доступ к словарю
-            if dictionary.owner != request.user:
-                from .models import Purchase
-                if not Purchase.objects.filter(user=request.user, dictionary=dictionary).exists():
-                    return Response(
-                        {'detail': 'You do not have access to this dictionary.'},
-                        status=status.HTTP_403_FORBIDDEN
-                    )
-            
-            # Получаем или создаём прогресс
-            progress, created = LearningProgress.objects.get_or_create(
-                user=request.user,
-                dictionary=dictionary,
-                defaults={}
-            )
-            
-            serializer = LearningProgressSerializer(progress)
-            return Response(serializer.data)
-            
-        except Dictionary.DoesNotExist:
-            return Response(
-                {'detail': 'Dictionary not found.'},
-                status=status.HTTP_404_NOT_FOUND
-            )
+        # Проверяем доступ к словарю
+        dictionary = get_accessible_dictionary(request.user, dictionary_id, 'id')
+        if dictionary is None:
+            return _no_access_response(dictionary_id)
+        
+        # GET только читает: прогресс создаётся через POST/PUT
+        progress = LearningProgress.objects.filter(
+            user=request.user,
+            dictionary=dictionary
+        ).first()
+        
+        if progress is None:
+            # Пустой прогресс с теми же полями, что и у сериализатора
+            return Response({
+                'id': None,
+                'dictionary': dictionary.id,
+                'learned_words': [],
+                'learned_words_count': 0,
+                'total_words': Word.objects.filter(dictionary_id=dictionary.id).count(),
+                'progress_percentage': 0,
+                'last_updated': None,
+            })
+        
+        serializer = LearningProgressSerializer(progress)
+        return Response(serializer.data)
 
     def post(self, request, dictionary_id):
         """
@@ -752,60 +1032,36 @@ class LearningProgressView(APIView):
         Returns:
             Response: Сохранённый прогресс изучения.
         """
-        try:
-            dictionary = Dictionary.objects.get(pk=dictionary_id)
-            
-            # Проверяем доступ к словарю
-            if dictionary.owner != request.user:
-                from .models import Purchase
-                if not Purchase.objects.filter(user=request.user, dictionary=dictionary).exists():
-                    return Response(
-                        {'detail': 'You do not have access to this dictionary.'},
-                        status=status.HTTP_403_FORBIDDEN
-                    )
-            
-            # Получаем или создаём прогресс
-            progress, created = LearningProgress.objects.get_or_create(
-                user=request.user,
-                dictionary=dictionary,
-                defaults={}
-            )
-            
-            # Обновляем данные
-            data = request.data.copy()
-            data['dictionary'] = dictionary.id
-            
-            serializer = LearningProgressSerializer(
-                progress,
-                data=data,
-                partial=True,
-                context={'request': request}
-            )
-            
-            if serializer.is_valid():
-                serializer.save()
-                status_code = status.HTTP_201_CREATED if created else status.HTTP_200_OK
-                return Response(serializer.data, status=status_code)
-            
-            return Response(
-                serializer.errors,
-                status=status.HTTP_400_BAD_REQUEST
-            )
-            
-        except Dictionary.DoesNotExist:
-            return Response(
-                {'detail': 'Dictionary not found.'},
-                status=status.HTTP_404_NOT_FOUND
-            )
-
-    def put(self, request, dictionary_id):
-        """
-        Обновить прогресс изучения словаря.
-
-        Args:
-            dictionary_id: ID словаря.
+        # Проверяем доступ к словарю
+        dictionary = get_accessible_dictionary(request.user, dictionary_id, 'id')
+        if dictionary is None:
+            return _no_access_response(dictionary_id)
+        
+        # Получаем или создаём прогресс
+        progress, created = LearningProgress.objects.get_or_create(
+            user=request.user,
+            dictionary=dictionary,
+            defaults={}
+        )
+        
+        # Обновляем данные (словарь уже задан в progress; поле dictionary
+        # только для чтения, поэтому значение из тела запроса игнорируется)
+        serializer = LearningProgressSerializer(
+            progress,
+            data=request.data,
+            partial=True,
+            context={'request': request}
+        )
+        
+        if serializer.is_valid():
+            serializer.save()
+            status_code = status.HTTP_201_CREATED if created else status.HTTP_200_OK
+            return Response(serializer.data, status=status_code)
+        
+        return Response(
+            serializer.errors,
+            status=status.HTTP_400_BAD_REQUEST
+        )
 
-        Returns:
-            Response: Обновлённый прогресс изучения.
-        """
-        return self.post(request, dictionary_id)
\ No newline at end of file
+    # PUT обрабатывается тем же методом, что и POST
+    put = post
\ No newline at end of file
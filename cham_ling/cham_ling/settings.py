@@ -8,12 +8,14 @@
 - CORS настройки для работы с фронтендом
 - JWT токены настройки
 """
+from datetime import timedelta
 from pathlib import Path
+from types import MappingProxyType
 from decouple import config
 import os
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
-BASE_DIR = Path(__file__).resolve().parent.parent
+BASE_DIR = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = config('SECRET_KEY', default='your-secret-key-here')
@@ -25,63 +27,83 @@ DEBUG = config('DEBUG', default=True, cast=bool)
 # В продакшене указать конкретные домены!
 ALLOWED_HOSTS = ['*']
 
+# Админ панель и нужные только ей сессии и сообщения.
+# В развёртывании только с API их можно отключить (ENABLE_ADMIN=False),
+# чтобы не загружать эти приложения при каждом запуске Django
+ENABLE_ADMIN = config('ENABLE_ADMIN', default=True, cast=bool)
+
 # Application definition
-INSTALLED_APPS = [
-    'django.contrib.admin',
+INSTALLED_APPS = (
+    *(('django.contrib.admin',) if ENABLE_ADMIN else ()),
     'django.contrib.auth',
     'django.contrib.contenttypes',
-    'django.contrib.sessions',
-    'django.contrib.messages',
+    *(('django.contrib.sessions', 'django.contrib.messages') if ENABLE_ADMIN else ()),
     'django.contrib.staticfiles',
     'rest_framework',
     'corsheaders',
     'api',  # Наше приложение с API
-]
+)
 
-MIDDLEWARE = [
+# Middleware сессий, пользователя и сообщений нужны только админке:
+# API аутентифицирует запросы через JWT средствами DRF
+MIDDLEWARE = (
     'django.middleware.security.SecurityMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
+    *(('django.contrib.sessions.middleware.SessionMiddleware',) if ENABLE_ADMIN else ()),
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
-    'django.contrib.messages.middleware.MessageMiddleware',
+    *((
+        'django.contrib.auth.middleware.AuthenticationMiddleware',
+        'django.contrib.messages.middleware.MessageMiddleware',
+    ) if ENABLE_ADMIN else ()),
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-]
+)
 
 ROOT_URLCONF = 'cham_ling.urls'
 
-TEMPLATES = [
+# Контекстные процессоры шаблонов (используются админкой)
+_CONTEXT_PROCESSORS = (
+    'django.template.context_processors.debug',
+    'django.template.context_processors.request',
+    'django.contrib.auth.context_processors.auth',
+    'django.contrib.messages.context_processors.messages',
+)
+
+TEMPLATES = (
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [],
         'APP_DIRS': True,
         'OPTIONS': {
-            'context_processors': [
-                'django.template.context_processors.debug',
-                'django.template.context_processors.request',
-                'django.contrib.auth.context_processors.auth',
-                'django.contrib.messages.context_processors.messages',
-            ],
+            'context_processors': _CONTEXT_PROCESSORS,
         },
     },
-]
+)
 
 WSGI_APPLICATION = 'cham_ling.wsgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
-if 'RDS_HOSTNAME' in os.environ:
+# Переменные RDS читаются из окружения одним проходом
+_RDS_KEYS = ('RDS_DB_NAME', 'RDS_USERNAME', 'RDS_PASSWORD', 'RDS_HOSTNAME', 'RDS_PORT')
+_rds = {key: os.environ[key] for key in _RDS_KEYS if key in os.environ}
+
+if 'RDS_HOSTNAME' in _rds:
     # Настройки для AWS Elastic Beanstalk с RDS PostgreSQL
     # Переменные окружения устанавливаются автоматически EB при подключении RDS
+    # (отсутствие любой из них - ошибка конфигурации, KeyError)
     DATABASES = {
         'default': {
             'ENGINE': 'django.db.backends.postgresql',
-            'NAME': os.environ['RDS_DB_NAME'],
-            'USER': os.environ['RDS_USERNAME'],
-            'PASSWORD': os.environ['RDS_PASSWORD'],
-            'HOST': os.environ['RDS_HOSTNAME'],
-            'PORT': os.environ['RDS_PORT'],
+            'NAME': _rds['RDS_DB_NAME'],
+            'USER': _rds['RDS_USERNAME'],
+            'PASSWORD': _rds['RDS_PASSWORD'],
+            'HOST': _rds['RDS_HOSTNAME'],
+            'PORT': _rds['RDS_PORT'],
+            # Постоянные соединения: не открываем новое соединение с RDS
+            # на каждый запрос, но проверяем его перед использованием
+            'CONN_MAX_AGE': 600,
+            'CONN_HEALTH_CHECKS': True,
         }
     }
 else:
@@ -94,39 +116,45 @@ else:
         }
     }
 
-# Password validation
-# https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
-AUTH_PASSWORD_VALIDATORS = [
-    {
-        'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
-    },
-    {
-        'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator',
-    },
-    {
-        'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator',
+# Кэш (память процесса). Страницы маркетплейса хранятся в отдельном
+# кэше, чтобы публичные запросы не вытесняли пользователей JWT
+# аутентификации и результаты Unsplash из основного кэша
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
     },
-    {
-        'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator',
+    'marketplace': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'marketplace',
     },
-]
+}
+
+# Password validation
+# https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
+# Валидаторы задаются только путями; словари {'NAME': ...} строятся из них
+_PASSWORD_VALIDATORS = (
+    'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
+    'django.contrib.auth.password_validation.MinimumLengthValidator',
+    'django.contrib.auth.password_validation.CommonPasswordValidator',
+    'django.contrib.auth.password_validation.NumericPasswordValidator',
+)
+AUTH_PASSWORD_VALIDATORS = tuple({'NAME': name} for name in _PASSWORD_VALIDATORS)
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.0/topics/i18n/
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
 USE_I18N = True
-USE_L10N = True
 USE_TZ = True
 
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/5.0/howto/static-files/
 STATIC_URL = '/static/'
-STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')  # Для collectstatic в продакшене
+STATIC_ROOT = BASE_DIR / 'staticfiles'  # Для collectstatic в продакшене
 
 # Media files (загружаемые пользователями)
 MEDIA_URL = '/media/'
-MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+MEDIA_ROOT = BASE_DIR / 'media'
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
@@ -137,13 +165,17 @@ AUTH_USER_MODEL = 'api.User'
 
 # REST Framework настройки
 # Используется JWT аутентификация для всех API endpoints
+# и постраничная выдача списков (по 50 элементов)
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    # Списки отдаются постранично, чтобы ответ не рос вместе с БД
+    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'PAGE_SIZE': 50,
 }
 
 # CORS настройки для работы с фронтендом
@@ -152,14 +184,14 @@ CORS_ALLOWED_ORIGINS_STR = config(
     'CORS_ALLOWED_ORIGINS',
     default='http://localhost:3000,http://127.0.0.1:3000'
 )
-CORS_ALLOWED_ORIGINS = [
-    origin.strip() for origin in CORS_ALLOWED_ORIGINS_STR.split(',') if origin.strip()
-]
+# Каждый источник обрезается один раз, пустые элементы отбрасываются
+CORS_ALLOWED_ORIGINS = list(filter(None, (
+    origin.strip() for origin in CORS_ALLOWED_ORIGINS_STR.split(',')
+)))
 
 # Разрешить все источники в режиме разработки (НЕ использовать в продакшене!)
 # В продакшене использовать CORS_ALLOWED_ORIGINS с конкретными доменами
-if DEBUG:
-    CORS_ALLOW_ALL_ORIGINS = True
+CORS_ALLOW_ALL_ORIGINS = DEBUG
 
 # Unsplash API ключ для автоматического подбора изображений
 # Получить ключ можно на https://unsplash.com/developers
@@ -169,17 +201,17 @@ UNSPLASH_API_KEY = config('UNSPLASH_API_KEY', default='')
 # ACCESS_TOKEN_LIFETIME: Время жизни access токена (60 минут)
 # REFRESH_TOKEN_LIFETIME: Время жизни refresh токена (1 день)
 # ROTATE_REFRESH_TOKENS: Автоматическая ротация refresh токенов при использовании
-from datetime import timedelta
-SIMPLE_JWT = {
+# Словарь только для чтения: настройки не должны меняться во время работы
+SIMPLE_JWT = MappingProxyType({
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
     'ROTATE_REFRESH_TOKENS': True,
-}
+})
 
 # Настройки аутентификации
 # EmailAuthBackend: Позволяет логиниться по email вместо username
 # ModelBackend: Стандартная Django аутентификация по username
-AUTHENTICATION_BACKENDS = [
+AUTHENTICATION_BACKENDS = (
     'api.backends.EmailAuthBackend',
     'django.contrib.auth.backends.ModelBackend',
-]
\ No newline at end of file
+)
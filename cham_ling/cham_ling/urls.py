@@ -2,25 +2,26 @@
 URL конфигурация для проекта ChamLing.
 
 Определяет маршруты для всех URL паттернов приложения:
-- Django admin панель (/admin/)
+- Django admin панель (/admin/, если ENABLE_ADMIN=True)
 - API endpoints (/api/)
 - Медиа файлы (только в режиме разработки)
 """
-from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
+if settings.ENABLE_ADMIN:
+    from django.contrib import admin
+
 urlpatterns = [
-    # Django admin панель для управления данными
-    path('admin/', admin.site.urls),
+    # Django admin панель для управления данными (если включена)
+    *((path('admin/', admin.site.urls),) if settings.ENABLE_ADMIN else ()),
     # API endpoints - все API маршруты определены в api/urls.py
     path('api/', include('api.urls')),
+    # Обслуживание медиафайлов (загруженные пользователями изображения)
+    # Работает только в режиме разработки: при DEBUG=False static()
+    # возвращает пустой список, а под python -O ветка не выполняется вовсе
+    # В продакшене медиа файлы должны обслуживаться веб-сервером (nginx/Apache)
+    # или через CDN (CloudFront, CloudFlare)
+    *(static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT) if __debug__ else ()),
 ]
-
-# Обслуживание медиафайлов (загруженные пользователями изображения)
-# Работает только в режиме разработки (DEBUG=True)
-# В продакшене медиа файлы должны обслуживаться веб-сервером (nginx/Apache)
-# или через CDN (CloudFront, CloudFlare)
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file